@@ -27,7 +27,12 @@ licenses/ にコピー + THIRD_PARTY_NOTICES.txt を生成します。
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import functools
+import io
+import itertools
+import os
 import re
 import shutil
 import sys
@@ -42,8 +47,26 @@ except Exception as e:
     raise SystemExit(f"importlib.metadata が利用できません: {e}")
 
 # LICENSE*, COPYING*, NOTICE* を拾う（例: LICENSE_BSD_Simple.txt / LICENSE-MIT / NOTICE.thirdparty など）
+# 仕様のドキュメントとして残す。ホットループでは同等の _is_license_name() を使う。
 LICENSE_BASENAME_RE = re.compile(r"^(LICENSE|COPYING|NOTICE)([._-].+)?$", re.IGNORECASE)
 
+_LIC_PREFIXES = ("LICENSE", "COPYING", "NOTICE")
+
+# License フィールドが“本文っぽい”ことを示す語。1 パスで走査できるよう union にまとめる
+_LICENSE_TEXT_HINT = re.compile(r"copyright|permission|warranty|redistribution|liability", re.IGNORECASE)
+
+
+def _is_license_name(name: str) -> bool:
+    """
+    LICENSE_BASENAME_RE と同じ判定を正規表現エンジンなしで行う。
+    RECORD の全エントリに対して呼ばれるため、backtracking regex を避ける。
+    """
+    u = name.upper()
+    return any(
+        u == p or u.startswith(p + ".") or u.startswith(p + "_") or u.startswith(p + "-")
+        for p in _LIC_PREFIXES
+    )
+
 
 @dataclass(frozen=True)
 class DistLicenseCopy:
@@ -53,23 +76,100 @@ class DistLicenseCopy:
     copied_files: Tuple[str, ...]  # relative filenames under output_dir
 
 
+# 許可文字以外（空白含む）を 1 パスで "_" に置換する
+_NORM_RE = re.compile(r"[^A-Za-z0-9._+-]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def _norm_name(name: str) -> str:
     # file name safety
-    s = re.sub(r"\s+", "_", name.strip())
-    s = re.sub(r"[^A-Za-z0-9._+-]", "_", s)
+    # 同じパッケージ名で何度も呼ばれる（exclude 判定 / prefix / 索引キー）ためメモ化
+    return _NORM_RE.sub("_", name.strip())
+
+
+@dataclass(frozen=True)
+class _DistCache:
+    """
+    dist ごとのメタデータ読み取り結果を 1 回だけ取得して束ねる内部キャッシュ。
+
+    importlib.metadata は dist.metadata / dist.files に触るたびに
+    METADATA / RECORD をディスクから再パースするため、
+    収集ループではこのキャッシュだけを参照する。
+    """
+
+    name: str
+    version: str
+    meta: importlib_metadata.PackageMetadata
+    files: Tuple[importlib_metadata.PackagePath, ...]
+    info_dir: Optional[Path]
+
+
+def _build_dist_cache(dist: importlib_metadata.Distribution) -> Optional[_DistCache]:
+    """
+    Distribution から name / version / metadata / files を一括で取り込む。
+
+    表示名は METADATA の Name（公開名）を使う。dist-info ディレクトリの stem は
+    wheel 正規化で '-' が '_' になっており、--exclude 判定や帰属表記（NOTICES）が
+    公開名とずれてしまう。metadata はライセンス推定でどのみち読むためコスト増もない。
+    version と info_dir のみ dist-info ディレクトリ名から補助的に読む。
+    """
+    info_dir: Optional[Path] = None
+    version = ""
+
+    # zip/egg 上の dist では _path が zipfile.Path（os.PathLike でない）になる
+    raw_path = getattr(dist, "_path", None)
+    if isinstance(raw_path, (str, os.PathLike)):
+        p = Path(raw_path)
+        if p.name.endswith(".dist-info"):
+            info_dir = p
+            stem = p.name[: -len(".dist-info")]
+            _, _, version = stem.partition("-")
+            if not version[:1].isdigit():
+                # 旧式の非正規化 dist-info 名（name 内に '-'）は素直に metadata へ
+                version = ""
+
+    # dist.name / dist.version は metadata プロパティ経由で METADATA を再パース
+    # するため使わず、取得済みの meta から読む
+    meta = dist.metadata
+    name = meta.get("Name") or ""
+    if not name:
+        return None
+    if not version:
+        version = meta.get("Version") or "UNKNOWN"
+
+    files = tuple(dist.files or ())
+    return _DistCache(name=name, version=version, meta=meta, files=files, info_dir=info_dir)
+
+
+@functools.lru_cache(maxsize=512)
+def _simplify_classifier(c: str) -> str:
+    """
+    License classifier 1 件を短い表記に簡約する。
+    classifier 文字列は venv 全体でほぼ同じものが繰り返されるためメモ化。
+    """
+    s = c.replace("License ::", "").strip()
+    # 軽い簡約（"OSI Approved ::" 等のノイズ除去、末尾 "License" 削除）
+    s = s.replace("OSI Approved ::", "").strip()
+    if s.endswith("License"):
+        s = s[: -len("License")].strip()
     return s
 
 
-def _infer_license_from_metadata(dist: importlib_metadata.Distribution) -> str:
+def _short_from_classifiers(items: List[str]) -> str:
+    if not items:
+        return ""
+    # dict.fromkeys で順序維持の重複除去を 1 パスで行う
+    return "; ".join(dict.fromkeys(_simplify_classifier(c) for c in items))
+
+
+def _infer_license_from_metadata(meta: importlib_metadata.PackageMetadata) -> str:
     """
-    dist.metadata から License を推定して返す（短文化版）。
+    metadata から License を推定して返す（短文化版）。
 
     重要:
     - 一部パッケージ（numpy等）では License フィールドに“ライセンス本文”が入ってしまうことがある。
       この場合 NOTICES が長文化し監査で誤解を招くため、Classifier由来の短い表記を優先する。
     """
-    meta = dist.metadata
-
     # 1) Classifier から License を抽出（短いことが多い）
     classifiers = meta.get_all("Classifier") or []
     lic_classifiers: List[str] = []
@@ -77,26 +177,6 @@ def _infer_license_from_metadata(dist: importlib_metadata.Distribution) -> str:
         if isinstance(c, str) and c.strip().startswith("License ::"):
             lic_classifiers.append(c.strip())
 
-    def _short_from_classifiers(items: List[str]) -> str:
-        if not items:
-            return ""
-        cleaned = [x.replace("License ::", "").strip() for x in items]
-        # 重複除去（順序維持）
-        seen = set()
-        uniq: List[str] = []
-        for x in cleaned:
-            if x not in seen:
-                seen.add(x)
-                uniq.append(x)
-        # 軽い簡約（"OSI Approved ::" 等のノイズ除去、末尾 "License" 削除）
-        simplified: List[str] = []
-        for x in uniq:
-            s = x.replace("OSI Approved ::", "").strip()
-            if s.endswith("License"):
-                s = s[:-len("License")].strip()
-            simplified.append(s)
-        return "; ".join(simplified)
-
     classifier_guess = _short_from_classifiers(lic_classifiers)
 
     # 2) License フィールド
@@ -110,9 +190,8 @@ def _infer_license_from_metadata(dist: importlib_metadata.Distribution) -> str:
             return True
         if len(s) > 120:
             return True
-        keywords = ["copyright", "permission", "warranty", "redistribution", "liability"]
-        low = s.lower()
-        return any(k in low for k in keywords)
+        # s.lower() のコピーを作らず、5 語の in 判定を 1 回の search で済ませる
+        return _LICENSE_TEXT_HINT.search(s) is not None
 
     if _looks_like_full_text(lic_field):
         return classifier_guess or "UNKNOWN"
@@ -130,24 +209,57 @@ def _site_packages_dir() -> Path:
     if p.is_dir():
         return p
     # fallback (念のため) Unix-like:
+    # "site-packages" はリテラルなので glob エンジンを通さず scandir + isdir で済ませる
     p2 = Path(sys.prefix) / "lib"
     if p2.is_dir():
-        for child in p2.glob("python*/site-packages"):
-            if child.is_dir():
-                return child
+        for e in os.scandir(p2):
+            if e.is_dir() and e.name.startswith("python"):
+                cand = os.path.join(e.path, "site-packages")
+                if os.path.isdir(cand):
+                    return Path(cand)
     raise SystemExit("site-packages ディレクトリを特定できません。venv が有効化されているか確認してください。")
 
 
-def _find_dist_info_dir(site_packages: Path, dist: importlib_metadata.Distribution) -> Optional[Path]:
+# PEP 503 相当のキー正規化: '-' / '_' / '.' の連なりを '_' 1 文字に畳んで小文字化する。
+# dist-info の stem は wheel 正規化で '-' が '_' になるため、公開名（METADATA の
+# Name、ハイフン入り）と突き合わせるにはこの畳み込みが必要。
+_KEY_RE = re.compile(r"[-_.]+")
+
+
+def _index_key(name: str) -> str:
+    return _KEY_RE.sub("_", name).lower()
+
+
+def _build_dist_info_index(site_packages: Path) -> dict:
+    """
+    site-packages を 1 回だけ走査し、(_index_key(name), version) → dist-info Path の
+    索引を作る。dist ごとの glob 走査（O(N^2)）を避けるため。
+    """
+    index: dict = {}
+    for d in os.scandir(site_packages):
+        if d.name.endswith(".dist-info") and d.is_dir():
+            stem = d.name[: -len(".dist-info")]
+            name, _, ver = stem.partition("-")
+            index[(_index_key(name), ver)] = Path(d.path)
+    return index
+
+
+def _find_dist_info_dir(site_packages: Path, cache: _DistCache, dist_info_index: dict) -> Optional[Path]:
     """
     dist-info ディレクトリを推定して返す。
-    dist-info 名の正確な推定が必要なことがあるため glob で補助する。
+    まず事前走査した索引を引き、外れた場合のみ glob + 正規表現で補助する。
     """
-    dist_name = dist.metadata.get("Name") or dist.name
-    dist_ver = dist.version or "UNKNOWN"
+    dist_name = cache.name
+    dist_ver = cache.version
+
+    hit = dist_info_index.get((_index_key(dist_name), dist_ver))
+    if hit is not None:
+        return hit
 
     # 正規化してざっくり探す
-    n = re.sub(r"[-_.]+", "[-_.]+", re.escape(dist_name))
+    # （区切り文字の連なりで分割してから escape する。全体を escape してから
+    #   置換すると '\-' の '\' が残って壊れた断片になる）
+    n = "[-_.]+".join(re.escape(part) for part in _KEY_RE.split(dist_name))
     v = re.escape(dist_ver)
     pattern = re.compile(rf"^{n}[-_.]+{v}\.dist-info$", re.IGNORECASE)
 
@@ -160,8 +272,8 @@ def _find_dist_info_dir(site_packages: Path, dist: importlib_metadata.Distributi
     for d in site_packages.glob("*.dist-info"):
         if not d.is_dir():
             continue
-        low = d.name.lower()
-        if _norm_name(dist_name).lower() in low and dist_ver.lower() in low:
+        low = _index_key(d.name)
+        if _index_key(dist_name) in low and _index_key(dist_ver) in low:
             candidates.append(d)
     if candidates:
         candidates.sort(key=lambda x: len(x.name))
@@ -170,9 +282,13 @@ def _find_dist_info_dir(site_packages: Path, dist: importlib_metadata.Distributi
     return None
 
 
-def _select_license_files_from_dist(dist: importlib_metadata.Distribution, dist_info_dir: Optional[Path]) -> List[Path]:
+def _select_license_files_from_dist(
+    dist: importlib_metadata.Distribution,
+    files: Tuple[importlib_metadata.PackagePath, ...],
+    dist_info_dir: Optional[Path],
+) -> List[Path]:
     """
-    dist.files からライセンス関連ファイルを抽出して返す。
+    キャッシュ済みの files（RECORD相当）からライセンス関連ファイルを抽出して返す。
     取れない場合は dist-info 配下を直接探索する。
     """
     paths: List[Path] = []
@@ -181,44 +297,60 @@ def _select_license_files_from_dist(dist: importlib_metadata.Distribution, dist_
         if p.is_file():
             paths.append(p)
 
-    # 1) dist.files（RECORD相当）から拾う
-    files = dist.files or []
+    # 1) files（RECORD相当）から拾う
+    #    エントリ数が多い（数千件）ため Path オブジェクトは作らず文字列だけで判定し、
+    #    locate_file()（Path 構築あり）はマッチしたときだけ呼ぶ
     if files:
+        found_canonical = False  # <dist-info>/licenses/（PEP 639 の正準位置）を見つけたか
         for f in files:
             s = str(f).replace("\\", "/")
-            base = Path(s).name
+            base = s.rsplit("/", 1)[-1]
+            s_lower = s.lower()
+
+            # RECORD のエントリは "<name>-<ver>.dist-info/licenses/..." 形式
+            # （".dist-info" の前にスラッシュは付かない）
+            in_canonical = ".dist-info/licenses/" in s_lower
+            if found_canonical and not in_canonical:
+                # 正準位置のまとまりを読み終えたら、巨大 RECORD の残りは走査しない
+                break
 
             # dist-info 直下
-            if "/.dist-info/" in s or s.endswith(".dist-info"):
-                if LICENSE_BASENAME_RE.match(base):
+            if ".dist-info/" in s or s.endswith(".dist-info"):
+                if _is_license_name(base):
+                    found_canonical = found_canonical or in_canonical
                     add_if_file(Path(dist.locate_file(f)))
                     continue
-                if "/.dist-info/licenses/" in s.lower():
+                if in_canonical:
+                    found_canonical = True
                     add_if_file(Path(dist.locate_file(f)))
                     continue
 
             # パッケージ直下（または任意階層）に LICENSE* があるケース
-            if LICENSE_BASENAME_RE.match(base):
+            if _is_license_name(base):
                 add_if_file(Path(dist.locate_file(f)))
                 continue
 
     # 2) 上で取れなかった場合は dist-info を探索
+    #    ライセンス本文は dist-info 直下か licenses/ 直下にしか置かれないため、
+    #    rglob ではなく浅い scandir 2 回で済ませる（stat 回数の削減）
     if not paths and dist_info_dir and dist_info_dir.is_dir():
-        for p in dist_info_dir.rglob("*"):
-            if not p.is_file():
-                continue
-            base = p.name
-            rel = str(p.relative_to(dist_info_dir)).replace("\\", "/").lower()
-            if LICENSE_BASENAME_RE.match(base):
-                paths.append(p)
-            elif rel.startswith("licenses/"):
-                paths.append(p)
-
-    # 重複排除（同一実体）
+        for entry in os.scandir(dist_info_dir):
+            if entry.is_file(follow_symlinks=False) and _is_license_name(entry.name):
+                paths.append(Path(entry.path))
+        licenses_dir = os.path.join(dist_info_dir, "licenses")
+        if os.path.isdir(licenses_dir):
+            for entry in os.scandir(licenses_dir):
+                if entry.is_file(follow_symlinks=False):
+                    paths.append(Path(entry.path))
+
+    # 重複排除（同一パス名）
+    # resolve() はパス成分ごとに readlink/stat が走るため、文字列処理だけの
+    # abspath + normcase をキーにする。symlink で同一実体を指す LICENSE は
+    # 別物として扱われるが、帰属表記の用途ではその方が安全。
     uniq: List[Path] = []
     seen: Set[str] = set()
     for p in paths:
-        key = str(p.resolve()).lower()
+        key = os.path.normcase(os.path.abspath(os.fspath(p)))
         if key not in seen:
             seen.add(key)
             uniq.append(p)
@@ -229,26 +361,38 @@ def _copy_with_unique_name(src: Path, out_dir: Path, prefix: str) -> str:
     """
     src を out_dir にコピーし、コピー後のファイル名（out_dir相対）を返す。
     同名が既にあれば _2, _3... を付ける。
+
+    宛先は O_CREAT|O_EXCL で 1 syscall で確保する（exists() の事前 stat が不要、
+    かつ並列ワーカー間でロックなしに安全）。確保できたらプレースホルダに上書きコピーする。
+
+    前提: out_dir は呼び出し側（collect_licenses）で作成済みであること。
     """
-    out_dir.mkdir(parents=True, exist_ok=True)
     base = src.name
 
     # prefix を付ける（パッケージ名-元ファイル名）
-    dst_name = f"{prefix}-{base}"
-    dst = out_dir / dst_name
-
-    if dst.exists():
-        stem = dst.stem
-        suffix = dst.suffix
-        i = 2
-        while True:
-            cand = out_dir / f"{stem}_{i}{suffix}"
-            if not cand.exists():
-                dst = cand
-                break
-            i += 1
-
-    shutil.copy2(src, dst)
+    dst = out_dir / f"{prefix}-{base}"
+    stem = dst.stem
+    suffix = dst.suffix
+
+    for i in itertools.count(2):
+        try:
+            fd = os.open(str(dst), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            os.close(fd)
+            break
+        except FileExistsError:
+            dst = out_dir / f"{stem}_{i}{suffix}"
+
+    # copy2 の stat/utime/chmod（+ copystat の xattr）は配布用ライセンス文には不要。
+    # データだけコピーして syscall を節約する。
+    try:
+        shutil.copyfile(src, dst)
+    except BaseException:
+        # コピー失敗時に 0 バイトのプレースホルダを出力ディレクトリに残さない
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        raise
     return dst.name
 
 
@@ -268,6 +412,49 @@ def _try_copy_python_license(out_dir: Path) -> Optional[str]:
     return None
 
 
+def _process_one_dist(
+    cache: _DistCache,
+    dist: importlib_metadata.Distribution,
+    site_packages: Path,
+    dist_info_index: dict,
+    output_dir: Path,
+) -> Tuple[DistLicenseCopy, List[str]]:
+    """
+    1 dist 分の収集処理（推定 → ライセンスファイル探索 → コピー）。
+    dist 間に依存がないためスレッドプールから並列に呼ばれる。
+    """
+    local_warnings: List[str] = []
+    dist_name = cache.name
+    dist_ver = cache.version
+    inferred = _infer_license_from_metadata(cache.meta)
+
+    dist_info_dir = cache.info_dir or _find_dist_info_dir(site_packages, cache, dist_info_index)
+    lic_files = _select_license_files_from_dist(dist, cache.files, dist_info_dir)
+
+    copied: List[str] = []
+    prefix = _norm_name(dist_name)
+
+    for lf in lic_files:
+        try:
+            copied_name = _copy_with_unique_name(lf, output_dir, prefix)
+            copied.append(copied_name)
+        except Exception as e:
+            local_warnings.append(f"[WARN] copy failed: {dist_name} {dist_ver} : {lf} : {e}")
+
+    if not copied:
+        local_warnings.append(f"[WARN] no license file found for: {dist_name} {dist_ver}")
+
+    return (
+        DistLicenseCopy(
+            dist_name=dist_name,
+            dist_version=dist_ver,
+            inferred_license=inferred,
+            copied_files=tuple(sorted(copied)),
+        ),
+        local_warnings,
+    )
+
+
 def collect_licenses(output_dir: Path, exclude: Set[str]) -> Tuple[List[DistLicenseCopy], List[str]]:
     """
     各ディストリビューションのライセンスを output_dir にコピー。
@@ -276,51 +463,42 @@ def collect_licenses(output_dir: Path, exclude: Set[str]) -> Tuple[List[DistLice
       - 警告メッセージ
     """
     site_packages = _site_packages_dir()
+    dist_info_index = _build_dist_info_index(site_packages)
     warnings: List[str] = []
 
     results: List[DistLicenseCopy] = []
-    dists = list(importlib_metadata.distributions())
 
-    def sort_key(d: importlib_metadata.Distribution) -> str:
-        n = (d.metadata.get("Name") or d.name or "").lower()
-        return n
-
-    for dist in sorted(dists, key=sort_key):
-        dist_name = dist.metadata.get("Name") or dist.name
-        if not dist_name:
-            continue
+    # メタデータ読み取りは dist ごとに 1 回だけ（_DistCache に束ねる）
+    caches: List[Tuple[_DistCache, importlib_metadata.Distribution]] = []
+    for dist in importlib_metadata.distributions():
+        cache = _build_dist_cache(dist)
+        if cache is not None:
+            caches.append((cache, dist))
 
+    targets: List[Tuple[_DistCache, importlib_metadata.Distribution]] = []
+    for cache, dist in sorted(caches, key=lambda t: t[0].name.lower()):
+        dist_name = cache.name
         norm = _norm_name(dist_name).lower()
         if norm in exclude or dist_name.lower() in exclude:
             continue
-
-        dist_ver = dist.version or "UNKNOWN"
-        inferred = _infer_license_from_metadata(dist)
-
-        dist_info_dir = _find_dist_info_dir(site_packages, dist)
-        lic_files = _select_license_files_from_dist(dist, dist_info_dir)
-
-        copied: List[str] = []
-        prefix = _norm_name(dist_name)
-
-        for lf in lic_files:
-            try:
-                copied_name = _copy_with_unique_name(lf, output_dir, prefix)
-                copied.append(copied_name)
-            except Exception as e:
-                warnings.append(f"[WARN] copy failed: {dist_name} {dist_ver} : {lf} : {e}")
-
-        if not copied:
-            warnings.append(f"[WARN] no license file found for: {dist_name} {dist_ver}")
-
-        results.append(
-            DistLicenseCopy(
-                dist_name=dist_name,
-                dist_version=dist_ver,
-                inferred_license=inferred,
-                copied_files=tuple(sorted(copied)),
-            )
-        )
+        targets.append((cache, dist))
+
+    # dist ごとの処理は stat/open/copy の I/O 待ちが支配的で独立しているため、
+    # スレッドプールで並列化して I/O 待ちを重ねる。
+    # mkdir はプール起動前に 1 回だけ（ワーカー間の mkdir 競合回避）
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_process_one_dist, cache, dist, site_packages, dist_info_index, output_dir)
+            for cache, dist in targets
+        ]
+        # submit 順（name 順）に回収して results / warnings の順序を決定的に保つ
+        for fut in futures:
+            copy, local_warnings = fut.result()
+            results.append(copy)
+            warnings.extend(local_warnings)
 
     # Python ライセンス（取れれば）→ NOTICES にも明示的に載せる
     py_copied = _try_copy_python_license(output_dir)
@@ -347,49 +525,51 @@ def write_third_party_notices(
     output_dir: Path,
 ) -> None:
     now = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    lines: List[str] = []
-    lines.append("THIRD PARTY NOTICES")
-    lines.append("")
-    lines.append(f"Generated: {now}")
-    # lines.append(f"Output license directory: {output_dir.as_posix()}")
-    lines.append(f"Output license directory: licenses")
-    lines.append("")
-    lines.append("This product bundles third-party software components.")
-    lines.append("The following notices are provided for attribution and license compliance.")
-    lines.append("")
+    # 細切れ文字列のリスト + join は一時コピーが増えるため、StringIO に直接書く
+    buf = io.StringIO()
+    buf.write("THIRD PARTY NOTICES\n")
+    buf.write("\n")
+    buf.write(f"Generated: {now}\n")
+    # buf.write(f"Output license directory: {output_dir.as_posix()}\n")
+    buf.write("Output license directory: licenses\n")
+    buf.write("\n")
+    buf.write("This product bundles third-party software components.\n")
+    buf.write("The following notices are provided for attribution and license compliance.\n")
+    buf.write("\n")
 
     for c in sorted(copies, key=lambda x: x.dist_name.lower()):
-        lines.append(f"- {c.dist_name} {c.dist_version}")
-        lines.append(f"  Declared/Detected License: {c.inferred_license}")
+        buf.write(f"- {c.dist_name} {c.dist_version}\n")
+        buf.write(f"  Declared/Detected License: {c.inferred_license}\n")
         if c.copied_files:
-            lines.append("  Included license files:")
+            buf.write("  Included license files:\n")
             for f in c.copied_files:
-                lines.append(f"    - licenses/{f}")
+                buf.write(f"    - licenses/{f}\n")
         else:
-            lines.append("  Included license files: (NOT FOUND)")
-        lines.append("")
+            buf.write("  Included license files: (NOT FOUND)\n")
+        buf.write("\n")
 
     if warnings:
-        lines.append("WARNINGS")
-        lines.append("")
+        buf.write("WARNINGS\n")
+        buf.write("\n")
         for w in warnings:
-            lines.append(w)
-        lines.append("")
+            buf.write(w)
+            buf.write("\n")
+        buf.write("\n")
 
-    notices_path.write_text("\n".join(lines), encoding="utf-8")
+    notices_path.write_text(buf.getvalue(), encoding="utf-8")
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument(
         "--output-dir",
-        default="release\licenses",
-        help="ライセンス本文をコピーするディレクトリ（既定: licenses）",
+        default=os.path.join("release", "licenses"),
+        help="ライセンス本文をコピーするディレクトリ（既定: release/licenses）",
     )
     p.add_argument(
         "--notices",
-        default="release\THIRD_PARTY_NOTICES.txt",
-        help="生成する THIRD_PARTY_NOTICES.txt のパス（既定: THIRD_PARTY_NOTICES.txt）",
+        default=os.path.join("release", "THIRD_PARTY_NOTICES.txt"),
+        help="生成する THIRD_PARTY_NOTICES.txt のパス（既定: release/THIRD_PARTY_NOTICES.txt）",
     )
     p.add_argument(
         "--exclude",
@@ -425,8 +605,9 @@ def main() -> int:
 
     not_found = [c for c in copies if not c.copied_files]
     print(f"[OK] Collected: {len(copies)} distributions")
-    print(f"[OK] Output: {output_dir.resolve()}")
-    print(f"[OK] Notices: {notices_path.resolve()}")
+    # resolve() は symlink 解決で realpath 相当の syscall が走るため、表示用は abspath で十分
+    print(f"[OK] Output: {Path(os.path.abspath(output_dir))}")
+    print(f"[OK] Notices: {Path(os.path.abspath(notices_path))}")
     if not_found:
         print(f"[WARN] No license file found for {len(not_found)} distributions. See WARNINGS in notices.")
     return 0